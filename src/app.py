@@ -3,10 +3,13 @@
 import streamlit as st
 from ui import setup_sidebar, display_chat
 from config import *
-from rag_module import handle_rag_mode, generate_rag_response
+from rag_module import handle_rag_mode, generate_rag_response, prefetch_rag_retrieval
 from non_rag_module import handle_non_rag_mode, generate_non_rag_response
 
 def main():
+    # Start retrieval for a submitted prompt before the sidebar and history are rendered
+    prefetch_rag_retrieval()
+
     st.title("💻 Enhanced Local RAG Chatbot 🤖")
     st.caption("🚀 A chatbot powered by LlamaIndex and Ollama 🦙")
 
@@ -21,7 +24,7 @@ def main():
     if is_rag_mode:
         handle_rag_mode(uploaded_files, generation_config)
     else:
-        handle_non_rag_mode()
+        handle_non_rag_mode(generation_config)
 
     # Handle chat interaction
     prompt = display_chat()
@@ -18,13 +18,20 @@ LLM_MODELS = {
     "Gemini 2": {"model_name": "gemma2", "timeout": 400.0}
 }
 
-selected_model = "Llama 3"
-LLM_MODEL = LLM_MODELS[selected_model]["model_name"]
-LLM_TIMEOUT = LLM_MODELS[selected_model]["timeout"]
+selected_model = "Llama 3"  # Default selection in the sidebar
+
+# Number of LLM clients kept warm in the model pool, keeping one server slot for EMBEDDING_MODEL
+MAX_LOADED_MODELS = int(os.environ['OLLAMA_MAX_LOADED_MODELS'])
+LLM_POOL_SIZE = max(MAX_LOADED_MODELS - 1, 1)
+MODEL_KEEP_ALIVE = "30m"  # Refreshed on every request, so idle models are released if the app goes away
+
+# Number of background workers for early retrieval
+PREFETCH_WORKERS = int(os.environ['OLLAMA_NUM_PARALLEL'])
 
 # Retrieval configurations
 DEFAULT_NUM_DOCS = 3  # Default number of documents to retrieve
 DEFAULT_SIMILARITY_THRESHOLD = 0.65  # Default similarity threshold
+HOT_SET_SIZE = 20  # Recent query embeddings kept per session for repeated prompts
 
 # Supported file types
 SUPPORTED_FILE_TYPES = ["txt", "pdf", "docx"]
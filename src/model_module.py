@@ -0,0 +1,78 @@
+#model_module.py
+import threading
+from collections import OrderedDict
+import ollama
+from llama_index.core.chat_engine import ContextChatEngine
+from llama_index.llms.ollama import Ollama
+from config import *
+
+# Warm model pool, least recently used first
+model_pool = OrderedDict()
+model_pool_lock = threading.Lock()
+
+def get_llm(model_key, generation_config):
+    """Return a warm LLM client for the selected model, creating it if needed."""
+    model_name = LLM_MODELS[model_key]["model_name"]
+    settings = (generation_config['num_ctx'], generation_config['temperature'])
+    evicted_names = []
+
+    with model_pool_lock:
+        entry = model_pool.get(model_name)
+        is_new = entry is None
+        if is_new or entry['settings'] != settings:
+            entry = {
+                'llm': Ollama(
+                    model=model_name,
+                    request_timeout=LLM_MODELS[model_key]["timeout"],
+                    num_ctx=generation_config['num_ctx'],
+                    temperature=generation_config['temperature'],
+                    keep_alive=MODEL_KEEP_ALIVE
+                ),
+                'settings': settings
+            }
+            model_pool[model_name] = entry
+        model_pool.move_to_end(model_name)
+
+        # Evict the least recently used models beyond the pool limit
+        while len(model_pool) > LLM_POOL_SIZE:
+            evicted_name, _ = model_pool.popitem(last=False)
+            evicted_names.append(evicted_name)
+
+    # Talk to the Ollama server outside the lock so other sessions are not blocked
+    for evicted_name in evicted_names:
+        unload_model(evicted_name)
+    if is_new:
+        threading.Thread(target=warm_model, args=(model_name,), daemon=True).start()
+
+    return entry['llm']
+
+def warm_model(model_name):
+    """Load a model into the Ollama server so the first request after a switch is not a cold start."""
+    try:
+        ollama.generate(model=model_name, keep_alive=MODEL_KEEP_ALIVE)
+        print(f"Loaded model '{model_name}' into the pool.")
+    except Exception as e:
+        print(f"Could not load model '{model_name}': {e}")
+        return
+
+    # The model may have been evicted while it was loading
+    with model_pool_lock:
+        evicted = model_name not in model_pool
+    if evicted:
+        unload_model(model_name)
+
+def unload_model(model_name):
+    """Ask the Ollama server to release a model evicted from the pool."""
+    try:
+        ollama.generate(model=model_name, keep_alive=0)
+        print(f"Unloaded model '{model_name}' from the pool.")
+    except Exception as e:
+        print(f"Could not unload model '{model_name}': {e}")
+
+def swap_llm(chat_engine, model_key, generation_config):
+    """Route an existing chat engine to the selected model without rebuilding its index."""
+    if not isinstance(chat_engine, ContextChatEngine):
+        raise TypeError(f"Cannot swap the LLM of a {type(chat_engine).__name__} chat engine.")
+    llm = get_llm(model_key, generation_config)
+    if chat_engine._llm is not llm:
+        chat_engine._llm = llm
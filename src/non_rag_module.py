@@ -2,42 +2,36 @@
 import time
 import streamlit as st
 import psutil
-import subprocess
+import ollama
 from llama_index.core import VectorStoreIndex, SimpleDirectoryReader, Settings
 from llama_index.embeddings.ollama import OllamaEmbedding
 from llama_index.llms.ollama import Ollama
 from llama_index.core.memory import ChatMemoryBuffer
 from config import *
+from model_module import get_llm
+
+def init_models_non_rag(generation_config):
+    """Initialize non-RAG model using a pooled Ollama client directly."""
+    model_name = LLM_MODELS[generation_config['model']]["model_name"]
 
-def init_models_non_rag():
-    """Initialize non-RAG model using Ollama directly."""
     def run_model(prompt, context=""):
         try:
             full_prompt = context + "\n" + prompt if context else prompt
-            command = ["ollama", "run", LLM_MODEL]
-            process = subprocess.run(
-                command,
-                input=full_prompt,
-                text=True,
-                capture_output=True,
-                check=True
-            )
-            return process.stdout
-        except subprocess.CalledProcessError as e:
-            return f"Error running Llama: {e.stderr}"
-        except FileNotFoundError:
-            return "Error: Ollama is not installed or not in PATH"
+            llm = get_llm(generation_config['model'], generation_config)
+            return llm.complete(full_prompt).text
+        except ollama.ResponseError as e:
+            return f"Error running {model_name}: {e.error}"
         except Exception as e:
             return f"An unexpected error occurred: {str(e)}"
 
     return run_model
 
-def handle_non_rag_mode():
-    if ('chat_engine' not in st.session_state or 
-        'current_mode' not in st.session_state or 
-        st.session_state['current_mode'] != 'non-rag'):
-        st.session_state['chat_engine'] = init_models_non_rag()
-        st.session_state['current_mode'] = 'non-rag'
+def handle_non_rag_mode(generation_config):
+    # Kept apart from the RAG chat engine so toggling modes does not rebuild the index
+    if ('non_rag_engine' not in st.session_state or 
+        st.session_state.get('non_rag_config') != generation_config):
+        st.session_state['non_rag_engine'] = init_models_non_rag(generation_config)
+        st.session_state['non_rag_config'] = generation_config
 
 def generate_non_rag_response(prompt):
     with st.chat_message('user'):
@@ -52,7 +46,7 @@ def generate_non_rag_response(prompt):
     context = "\n".join([msg['content'] for msg in st.session_state.messages if msg['role'] == 'assistant'])
 
     # Generate response
-    response = st.session_state['chat_engine'](prompt, context)
+    response = st.session_state['non_rag_engine'](prompt, context)
 
     # End timing and resource monitoring
     end_time = time.time()
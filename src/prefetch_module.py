@@ -0,0 +1,73 @@
+#prefetch_module.py
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from llama_index.core import QueryBundle, Settings
+from llama_index.core.retrievers import BaseRetriever
+from config import *
+
+# Background workers for early query embedding and retrieval, shared by all sessions.
+# Sized to Ollama's parallel request slots, since extra workers would only queue on the server.
+prefetch_executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS)
+
+def normalize_prompt(prompt):
+    """Normalize a prompt so repeats differing only in case or spacing share an embedding."""
+    return " ".join(prompt.lower().split())
+
+class HotSetRetriever(BaseRetriever):
+    """Retriever that reuses recent query embeddings and retrieves prompts ahead of time."""
+
+    def __init__(self, index, num_docs, hot_set_size=HOT_SET_SIZE):
+        super().__init__()
+        self._retriever = index.as_retriever(similarity_top_k=num_docs)
+        self._embed_model = Settings.embed_model
+        self._hot_set_size = hot_set_size
+        self._hot_set = OrderedDict()  # normalized prompt -> query embedding, least recently used first
+        self._pending = None  # (query string, Future) of the latest prefetch
+        self._lock = threading.Lock()
+
+    def prefetch(self, query_str):
+        """Start embedding and retrieval for a prompt in the background."""
+        with self._lock:
+            # Only the latest prompt is kept; an unconsumed prefetch from an interrupted run is dropped
+            if self._pending is not None:
+                self._pending[1].cancel()
+            self._pending = (query_str, prefetch_executor.submit(self._retrieve_nodes, query_str))
+
+    def clear(self):
+        """Drop the hot set and any pending prefetch, e.g. when a new conversation starts."""
+        with self._lock:
+            if self._pending is not None:
+                self._pending[1].cancel()
+                self._pending = None
+            self._hot_set.clear()
+
+    def _retrieve(self, query_bundle):
+        with self._lock:
+            pending, self._pending = self._pending, None
+        if pending is not None:
+            query_str, future = pending
+            # A prefetch still queued behind other sessions is cancelled and run here instead
+            if not future.cancel() and query_str == query_bundle.query_str:
+                return future.result()
+        return self._retrieve_nodes(query_bundle.query_str)
+
+    def _retrieve_nodes(self, query_str):
+        """Retrieve from the index, embedding the query only if it is not in the hot set."""
+        query_embedding = self._get_query_embedding(query_str)
+        return self._retriever.retrieve(QueryBundle(query_str, embedding=query_embedding))
+
+    def _get_query_embedding(self, query_str):
+        """Return the query embedding from the hot set, or embed it and remember it."""
+        key = normalize_prompt(query_str)
+        with self._lock:
+            if key in self._hot_set:
+                self._hot_set.move_to_end(key)
+                return self._hot_set[key]
+
+        query_embedding = self._embed_model.get_query_embedding(query_str)
+        with self._lock:
+            self._hot_set[key] = query_embedding
+            while len(self._hot_set) > self._hot_set_size:
+                self._hot_set.popitem(last=False)
+        return query_embedding
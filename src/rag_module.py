@@ -4,8 +4,8 @@ from utils import handle_file_upload, get_files_hash
 import time
 from llama_index.core import VectorStoreIndex, SimpleDirectoryReader, Settings
 from llama_index.embeddings.ollama import OllamaEmbedding
-from llama_index.llms.ollama import Ollama
 from llama_index.core.memory import ChatMemoryBuffer
+from llama_index.core.chat_engine import ContextChatEngine
 from config import *
 from cache_module import cache_response
 from cache_module import check_cache
@@ -13,19 +13,15 @@ from retrieval_module import add_retrieval_controls
 from retrieval_module import format_source_info
 from feedback_module import collect_user_feedback
 from performance_module import ResourceMonitor
+from model_module import get_llm, swap_llm
+from prefetch_module import HotSetRetriever
 
 def init_models_rag(temp_dir, generation_config):
     """Initialize RAG models with LlamaIndex and set retrieval parameters."""
     embed_model = OllamaEmbedding(model_name=EMBEDDING_MODEL)
     Settings.embed_model = embed_model
 
-    llm = Ollama(
-        model=LLM_MODEL,
-        request_timeout=LLM_TIMEOUT,
-        num_ctx=generation_config['num_ctx'],
-        temperature=generation_config['temperature']
-    )
-    Settings.llm = llm
+    llm = get_llm(generation_config['model'], generation_config)
 
     # Get current retrieval parameters
     num_docs = st.session_state.get('num_docs', 3)
@@ -39,12 +35,15 @@ def init_models_rag(temp_dir, generation_config):
         similarity_threshold=similarity_threshold
     )
 
+    # Retriever with a per-session hot set of query embeddings and background prefetching
+    retriever = HotSetRetriever(index, num_docs)
+
     memory = ChatMemoryBuffer.from_defaults(token_limit=DEFAULT_TOKEN_LIMIT)
-    chat_engine = index.as_chat_engine(
-        chat_mode="context",
+    chat_engine = ContextChatEngine.from_defaults(
+        retriever=retriever,
         memory=memory,
         system_prompt=DEFAULT_SYSTEM_PROMPT,
-        verbose=True
+        llm=llm
     )
 
     return chat_engine
@@ -83,6 +82,19 @@ def handle_rag_mode(uploaded_files, generation_config):
         st.sidebar.success("Files uploaded successfully.")
         st.session_state['chat_engine'] = init_models_rag(uploaded_files, generation_config)
 
+    # Swap only the LLM client when the selected model changes
+    st.session_state['llm_model'] = generation_config['model']
+    if 'chat_engine' in st.session_state:
+        swap_llm(st.session_state['chat_engine'], generation_config['model'], generation_config)
+
+def prefetch_rag_retrieval():
+    """Start retrieval for a just-submitted prompt before the page is rendered."""
+    prompt = st.session_state.get('chat_prompt')
+    chat_engine = st.session_state.get('chat_engine')
+    if prompt and st.session_state.get('rag_mode', True) and \
+            isinstance(getattr(chat_engine, '_retriever', None), HotSetRetriever):
+        chat_engine._retriever.prefetch(prompt)
+
 def generate_rag_response(prompt):
     if 'chat_engine' not in st.session_state:
         st.error("Please upload files first or switch to non-RAG mode.")
@@ -90,7 +102,8 @@ def generate_rag_response(prompt):
 
     current_params = {
         'num_docs': st.session_state['num_docs'],
-        'similarity_threshold': st.session_state['similarity_threshold']
+        'similarity_threshold': st.session_state['similarity_threshold'],
+        'llm_model': st.session_state['llm_model']
     }
 
     # Check cache
@@ -106,6 +119,8 @@ def generate_rag_response(prompt):
         collect_user_feedback(response_id=f"cached_{hash(prompt)}")
         return
 
+    chat_engine = st.session_state['chat_engine']
+
     with st.chat_message('user'):
         st.markdown(prompt)
 
@@ -119,8 +134,6 @@ def generate_rag_response(prompt):
     monitor = ResourceMonitor()
     monitor.start_monitoring()
 
-    chat_engine = st.session_state['chat_engine']
-
     with st.chat_message('assistant'):
         message_placeholder = st.empty()
         res = ''
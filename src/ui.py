@@ -2,12 +2,13 @@
 import streamlit as st
 from config import *
 from llama_index.core.memory import ChatMemoryBuffer
+from prefetch_module import HotSetRetriever
 
 def setup_sidebar():
     with st.sidebar:
         st.header("Chat Mode")
         is_rag_mode = st.checkbox(
-            'RAG Mode 📚', value=True, 
+            'RAG Mode 📚', value=True, key='rag_mode',
             help="Toggle between RAG and non-RAG mode"
         )
 
@@ -40,12 +41,14 @@ def setup_sidebar():
         with col2:
             st.button('Clear History', on_click=clear_chat_history)
 
-    return is_rag_mode, uploaded_files, {'num_ctx': max_length, 'temperature': temperature}
+    return is_rag_mode, uploaded_files, {'model': llm_model, 'num_ctx': max_length, 'temperature': temperature}
 
 def create_new_conversation():
     st.session_state.messages = [{"role": "assistant", "content": "Hello, I'm your assistant, how can I help you?"}]
     if 'chat_engine' in st.session_state:
         st.session_state.chat_engine._memory = ChatMemoryBuffer.from_defaults(token_limit=DEFAULT_TOKEN_LIMIT)
+        if isinstance(getattr(st.session_state.chat_engine, '_retriever', None), HotSetRetriever):
+            st.session_state.chat_engine._retriever.clear()
         
 def clear_chat_history():
     st.session_state.messages = [{"role": "assistant", "content": "Hello, I'm your assistant, how can I help you?"}]
@@ -55,4 +58,4 @@ def display_chat():
         with st.chat_message(message['role']):
             st.markdown(message['content'])
 
-    return st.chat_input("Ask a question:")
+    return st.chat_input("Ask a question:", key='chat_prompt')